@@ -0,0 +1,776 @@
+import asyncio
+import logging
+from concurrent.futures import Future
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import AsyncIterator
+import pytz
+import os
+import json
+import operator
+import random
+import threading
+from time import monotonic, sleep
+
+from dateutil import parser
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+import base64
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+import email.utils
+from langchain_auth import Client
+
+from langchain_core.tools import tool
+from langchain_core.pydantic_v1 import BaseModel, Field
+from langchain_core.runnables.config import ensure_config
+
+from eaia.main.config import get_config
+from eaia.schemas import EmailData
+
+logger = logging.getLogger(__name__)
+_SCOPES = (
+    "https://www.googleapis.com/auth/gmail.modify",
+    "https://www.googleapis.com/auth/calendar",
+)
+# How long (in seconds) an access token from the auth service is reused before
+# asking for a fresh one
+_CREDENTIALS_TTL = 5 * 60
+# Lifetime of a Google access token. The auth service doesn't report expiry,
+# so tokens refreshed after a 401 are assumed to last this long
+_TOKEN_LIFETIME = timedelta(hours=1)
+# Both keyed by (user email, LangSmith API key)
+_credentials_cache: dict[tuple[str, str | None], tuple[float, Credentials]] = {}
+_credentials_pending: dict[tuple[str, str | None], Future] = {}
+_credentials_lock = threading.Lock()
+_BODY_MIME_TYPES = frozenset(("text/plain", "text/html"))
+_RECIPIENT_HEADERS = frozenset(("to", "cc"))
+# Headers send_email reads from the message it replies to
+_REPLY_HEADERS = ["Message-ID", "Subject", "From", "To", "Cc"]
+# Gmail accepts up to 100 calls per batch but throttles batches larger than 50
+_BATCH_SIZE = 50
+# Batch sub-requests failing with these statuses are throttled or transient and
+# are re-sent, up to _BATCH_RETRIES times
+_RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+_BATCH_RETRIES = 3
+# Longest Retry-After (in seconds) a batch will wait out; sub-requests asked to
+# wait longer are given up on
+_MAX_RETRY_DELAY = 30
+# Retries googleapiclient makes itself (with jittered exponential backoff) on
+# 429/5xx for single idempotent calls. Sends and inserts are not retried, so
+# a timed-out request can't be applied twice
+_NUM_RETRIES = 3
+# Number of fetched pages fetch_group_emails buffers ahead of its caller
+_PREFETCH_PAGES = 2
+_EVENT_SEPARATOR = "-" * 40 + "\n"
+# How long (in seconds) a formatted day from get_events_for_days is reused
+_CALENDAR_CACHE_TTL = 60
+_calendar_cache: dict[tuple[str, str], tuple[float, str]] = {}
+_calendar_lock = threading.Lock()
+_thread_local = threading.local()
+# Event loop the sync helpers run coroutines on, started on first use
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+_get_ids = operator.itemgetter("id", "threadId")
+_get_required_headers = operator.itemgetter("Subject", "Date")
+
+
+async def get_credentials(
+    user_email: str,
+    langsmith_api_key: str | None = None
+) -> Credentials:
+    """Get Google API credentials using langchain auth-client.
+    
+    Args:
+        user_email: User's Gmail email address (used as user_id for auth)
+        langsmith_api_key: LangSmith API key for auth client
+        
+    Returns:
+        Google OAuth2 credentials
+    """
+    key = (user_email, langsmith_api_key)
+    cached = _credentials_cache.get(key)
+    if cached is not None and monotonic() - cached[0] < _CREDENTIALS_TTL:
+        return cached[1]
+
+    # Callers run on different event loops (sync helpers go through the
+    # background loop in _run_sync), so concurrent misses share one fetch
+    # rather than each hitting the auth service. The fetch runs as its own task
+    # on the background loop, so cancelling any one caller leaves it running
+    # for the others
+    with _credentials_lock:
+        # A fetch that just finished may have filled the cache since the check above
+        cached = _credentials_cache.get(key)
+        if cached is not None and monotonic() - cached[0] < _CREDENTIALS_TTL:
+            return cached[1]
+        pending = _credentials_pending.get(key)
+        if pending is None:
+            pending = _credentials_pending[key] = (
+                asyncio.run_coroutine_threadsafe(
+                    _fetch_credentials(user_email, langsmith_api_key), _get_loop()
+                )
+            )
+    # Shielded so a cancelled caller does not cancel the shared fetch
+    return await asyncio.shield(asyncio.wrap_future(pending))
+
+
+async def _fetch_credentials(
+    user_email: str, langsmith_api_key: str | None
+) -> Credentials:
+    try:
+        creds = await _authenticate(user_email, langsmith_api_key)
+        # Cached tokens can expire before the TTL does; on a 401 the Google
+        # client calls this handler for a fresh token and retries the request
+        creds.refresh_handler = partial(
+            _refresh_token, user_email, langsmith_api_key, creds
+        )
+        _credentials_cache[(user_email, langsmith_api_key)] = (monotonic(), creds)
+        return creds
+    finally:
+        with _credentials_lock:
+            del _credentials_pending[(user_email, langsmith_api_key)]
+
+
+def _refresh_token(user_email, langsmith_api_key, creds, request, scopes):
+    """Refresh handler for cached credentials.
+
+    Drops the rejected `creds` from the cache and fetches a new token from the
+    auth service. Called by the Google client from the worker thread that got the
+    401.
+    """
+    key = (user_email, langsmith_api_key)
+    with _credentials_lock:
+        # Threads sharing `creds` can hit the same 401; only the first evicts, so
+        # the rest pick up the token it fetched instead of fetching again
+        cached = _credentials_cache.get(key)
+        if cached is not None and cached[1] is creds:
+            del _credentials_cache[key]
+    fresh = _run_sync(get_credentials(user_email, langsmith_api_key))
+    return fresh.token, datetime.now(UTC).replace(tzinfo=None) + _TOKEN_LIFETIME
+
+
+async def _authenticate(user_email: str, langsmith_api_key: str | None) -> Credentials:
+    """Fetch a fresh Google access token for `user_email` from the auth service."""
+    api_key = langsmith_api_key or os.getenv("LANGSMITH_API_KEY")
+    if not api_key:
+        raise ValueError("LANGSMITH_API_KEY environment variable must be set")
+    
+    client = Client(api_key=api_key)
+    
+    try:
+        # Authenticate with Google using the user's email as user_id
+        auth_result = await client.authenticate(
+            provider="google",
+            scopes=_SCOPES,
+            user_id=user_email
+        )
+        
+        if auth_result.needs_auth:
+            print(f"Please visit: {auth_result.auth_url}")
+            print("Complete the OAuth flow and then retry.")
+            
+            # Wait for completion outside of LangGraph context
+            completed_result = await client.wait_for_completion(
+                auth_id=auth_result.auth_id,
+                timeout=300
+            )
+            token = completed_result.token
+        else:
+            token = auth_result.token
+        
+        if not token:
+            raise ValueError("Failed to obtain access token")
+        
+        # Create credentials object from the token
+        # langchain auth-client returns the access token as a string
+        creds = Credentials(
+            token=token,
+            scopes=_SCOPES
+        )
+        
+        return creds
+        
+    finally:
+        await client.close()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="eaia-gmail-loop", daemon=True
+            ).start()
+    return _loop
+
+
+def _run_sync(coro):
+    """Run a coroutine from sync code and wait for its result.
+
+    The coroutine runs on one long-lived background loop, so each call skips the
+    loop setup and teardown asyncio.run would do. This also works from threads
+    that already have a running loop.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def _build_service(api: str, version: str, creds: Credentials):
+    """Build a Google API client, reusing the one this thread last built for `creds`.
+
+    The underlying httplib2 connection is not thread-safe, so clients are cached
+    per thread and must not be handed to other threads.
+    """
+    services = getattr(_thread_local, "services", None)
+    if services is None:
+        services = _thread_local.services = {}
+    cached = services.get((api, version))
+    if cached is None or cached[0] is not creds:
+        cached = services[(api, version)] = (
+            creds,
+            build(api, version, credentials=creds),
+        )
+    return cached[1]
+
+
+def extract_message_part(msg):
+    """Recursively walk through the email parts to find message body."""
+    if msg["mimeType"] in _BODY_MIME_TYPES:
+        body_data = msg.get("body", {}).get("data")
+        if body_data:
+            return base64.urlsafe_b64decode(body_data).decode("utf-8")
+    if "parts" in msg:
+        for part in msg["parts"]:
+            body = extract_message_part(part)
+            if body:
+                return body
+    return "No message body available."
+
+
+def _header_map(headers):
+    """Map header names to values, keeping the first value of repeated headers."""
+    return {header["name"]: header["value"] for header in reversed(headers)}
+
+
+def parse_time(send_time: str):
+    try:
+        parsed_time = parser.parse(send_time)
+        return parsed_time
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Error parsing time: {send_time} - {e}")
+
+
+def create_message(sender, to, subject, message_text, thread_id, original_message_id):
+    message = MIMEMultipart()
+    message["to"] = ", ".join(to)
+    message["from"] = sender
+    message["subject"] = subject
+    message["In-Reply-To"] = original_message_id
+    message["References"] = original_message_id
+    message["Message-ID"] = email.utils.make_msgid()
+    msg = MIMEText(message_text)
+    message.attach(msg)
+    raw = base64.urlsafe_b64encode(message.as_bytes())
+    raw = raw.decode()
+    return {"raw": raw, "threadId": thread_id}
+
+
+def get_recipients(
+    headers,
+    email_address,
+    addn_receipients=None,
+):
+    recipients = set(addn_receipients or [])
+    sender = None
+    for header in headers:
+        name = header["name"].lower()
+        if name in _RECIPIENT_HEADERS:
+            recipients.update(header["value"].replace(" ", "").split(","))
+        elif name == "from":
+            sender = header["value"]
+    if sender:
+        recipients.add(sender)  # Ensure the original sender is included in the response
+    return [r for r in recipients if email_address not in r]
+
+
+def _execute_batch(service, requests):
+    """Execute requests through the API's batch endpoint.
+
+    Sub-requests that are throttled or hit a transient server error are re-sent
+    in a smaller batch after a jittered backoff that honours Retry-After up to
+    _MAX_RETRY_DELAY seconds.
+
+    Args:
+    service: Gmail or Calendar API service used to build the batch.
+    requests: Mapping of request id to the HttpRequest to run.
+
+    Returns: responses keyed by request id. Requests that failed are logged and left out.
+    """
+    responses = {}
+    retryable = {}
+
+    def _collect(request_id, response, exception):
+        if exception is None:
+            responses[request_id] = response
+        elif (
+            isinstance(exception, HttpError)
+            and exception.resp.status in _RETRYABLE_STATUSES
+        ):
+            retryable[request_id] = exception
+        else:
+            logger.info(f"Batch request {request_id} failed: {exception}")
+
+    items = list(requests.items())
+    for start in range(0, len(items), _BATCH_SIZE):
+        pending = dict(items[start : start + _BATCH_SIZE])
+        for attempt in range(_BATCH_RETRIES + 1):
+            retryable.clear()
+            batch = service.new_batch_http_request(callback=_collect)
+            for request_id, request in pending.items():
+                batch.add(request, request_id=request_id)
+            try:
+                batch.execute()
+            except Exception as e:
+                # The batch call itself failed (an HTTP error, timeout or dropped
+                # connection), so send what it didn't return one by one
+                logger.info(f"Batch request failed, retrying individually: {e}")
+                for request_id, request in pending.items():
+                    if request_id in responses:
+                        continue
+                    try:
+                        responses[request_id] = request.execute(
+                            num_retries=_NUM_RETRIES
+                        )
+                    except Exception as e:
+                        logger.info(f"Request {request_id} failed: {e}")
+                break
+            # Give up on sub-requests that are out of retries or that the server
+            # wants held off for longer than we are willing to block
+            for request_id, exception in list(retryable.items()):
+                if attempt == _BATCH_RETRIES or (
+                    _retry_after(exception) > _MAX_RETRY_DELAY
+                ):
+                    logger.info(f"Batch request {request_id} failed: {exception}")
+                    del retryable[request_id]
+            if not retryable:
+                break
+            delay = max(2**attempt, *map(_retry_after, retryable.values()))
+            sleep(delay + random.uniform(0, 1))
+            pending = {request_id: pending[request_id] for request_id in retryable}
+    return responses
+
+
+def _retry_after(error):
+    """Seconds the server asked us to wait before retrying, or 0 if it didn't say."""
+    try:
+        return float(error.resp.get("retry-after", 0))
+    except ValueError:
+        # Retry-After can also be an HTTP date; fall back to the backoff
+        return 0
+
+
+def _list_messages(creds, query, page_token):
+    """List one page of message ids matching `query`.
+
+    Pages are capped at one batch worth of ids so each page is fetched in a
+    single batch call and only a few pages of payloads are held in memory.
+    """
+    service = _build_service("gmail", "v1", creds)
+    return (
+        service.users()
+        .messages()
+        .list(userId="me", q=query, pageToken=page_token, maxResults=_BATCH_SIZE)
+        .execute(num_retries=_NUM_RETRIES)
+    )
+
+
+def _batch_get(creds, resource, ids, **params):
+    """Get Gmail `messages` or `threads` by id in batches, keyed by id."""
+    service = _build_service("gmail", "v1", creds)
+    get = getattr(service.users(), resource)().get
+    return _execute_batch(
+        service, {id_: get(userId="me", id=id_, **params) for id_ in ids}
+    )
+
+
+def send_message(service, user_id, message):
+    message = service.users().messages().send(userId=user_id, body=message).execute()
+    return message
+
+
+def send_email(
+    email_id,
+    response_text,
+    email_address,
+    gmail_token: str | None = None,
+    gmail_secret: str | None = None,
+    addn_receipients=None,
+):
+    creds = _run_sync(get_credentials(email_address))
+
+    service = _build_service("gmail", "v1", creds)
+    # Only the headers are needed to thread and address the reply
+    message = (
+        service.users()
+        .messages()
+        .get(
+            userId="me",
+            id=email_id,
+            format="metadata",
+            metadataHeaders=_REPLY_HEADERS,
+        )
+        .execute(num_retries=_NUM_RETRIES)
+    )
+
+    headers = message["payload"]["headers"]
+    message_id = next(
+        header["value"] for header in headers if header["name"].lower() == "message-id"
+    )
+    thread_id = message["threadId"]
+
+    # Get recipients and sender
+    recipients = get_recipients(headers, email_address, addn_receipients)
+
+    # Create the response
+    subject = next(
+        header["value"] for header in headers if header["name"].lower() == "subject"
+    )
+    response_subject = subject
+    response_message = create_message(
+        "me", recipients, response_subject, response_text, thread_id, message_id
+    )
+    # Send the response
+    send_message(service, "me", response_message)
+
+
+def _parse_listed_message(message, msgs, threads, to_email):
+    """Turn a listed message into the item fetch_group_emails should yield.
+
+    Returns a `user_respond` marker when the user sent the last message in the
+    thread, the email itself when it is the latest message from someone else,
+    or None when there is nothing to process.
+    """
+    message_id, thread_id = _get_ids(message)
+    msg = msgs[message_id]
+    payload = msg["payload"]
+    headers = _header_map(payload.get("headers"))
+    thread = threads[thread_id]
+    messages_in_thread = thread["messages"]
+    # Check the last message in the thread
+    last_message = messages_in_thread[-1]
+    from_header = _header_map(last_message["payload"]["headers"])["From"]
+    if to_email in from_header:
+        return {
+            "id": message_id,
+            "thread_id": thread_id,
+            "user_respond": True,
+        }
+    # Check if the last message was from you and if the current message is the last in the thread
+    if message_id != last_message["id"]:
+        return None
+    subject, send_time = _get_required_headers(headers)
+    from_email = headers.get("From", "").strip()
+    _to_email = headers.get("To", "").strip()
+    if reply_to := headers.get("Reply-To", "").strip():
+        from_email = reply_to
+    # Only process emails that are less than an hour old
+    parsed_time = parse_time(send_time)
+    body = extract_message_part(payload)
+    return {
+        "from_email": from_email,
+        "to_email": _to_email,
+        "subject": subject,
+        "page_content": body,
+        "id": message_id,
+        "thread_id": thread_id,
+        "send_time": parsed_time.isoformat(),
+    }
+
+
+async def _fetch_pages(creds, query, out: asyncio.Queue):
+    """Put each page of listed messages, with their messages and threads, on `out`.
+
+    A None sentinel is put on `out` once every page has been fetched or fetching fails.
+    """
+    try:
+        nextPageToken = None
+        # googleapiclient is blocking, so every request runs in a worker thread to
+        # keep the event loop free for other graph runs
+        while True:
+            results = await asyncio.to_thread(
+                _list_messages, creds, query, nextPageToken
+            )
+            page = results.get("messages", [])
+            # Fetch the page's messages and each distinct thread once, through
+            # Gmail's batch endpoint instead of one HTTP round-trip per call. The
+            # listing already carries thread ids, so both batches run concurrently
+            msgs, threads = await asyncio.gather(
+                asyncio.to_thread(
+                    _batch_get, creds, "messages", [m["id"] for m in page]
+                ),
+                # Only the last message's id and sender are read from each thread,
+                # so skip downloading every message body in it
+                asyncio.to_thread(
+                    _batch_get,
+                    creds,
+                    "threads",
+                    dict.fromkeys(m["threadId"] for m in page),
+                    format="metadata",
+                    metadataHeaders=["From"],
+                ),
+            )
+            await out.put((page, msgs, threads))
+            nextPageToken = results.get("nextPageToken")
+            if not nextPageToken:
+                break
+    except Exception:
+        # Wake the consumer so it can re-raise the error from the task
+        await out.put(None)
+        raise
+    await out.put(None)
+
+
+async def fetch_group_emails(
+    to_email,
+    minutes_since: int = 30,
+    gmail_token: str | None = None,
+    gmail_secret: str | None = None,
+) -> AsyncIterator[EmailData]:
+    creds = await get_credentials(to_email)
+
+    after = int((datetime.now() - timedelta(minutes=minutes_since)).timestamp())
+
+    query = f"(to:{to_email} OR from:{to_email}) after:{after}"
+    count = 0
+    # Fetch pages in the background while the caller works through the current
+    # one; the bounded queue keeps the fetcher at most a couple of pages ahead
+    pages = asyncio.Queue(maxsize=_PREFETCH_PAGES)
+    fetcher = asyncio.create_task(_fetch_pages(creds, query, pages))
+    try:
+        while (fetched := await pages.get()) is not None:
+            page, msgs, threads = fetched
+            for message in page:
+                try:
+                    email_data = _parse_listed_message(
+                        message, msgs, threads, to_email
+                    )
+                except Exception:
+                    logger.info(f"Failed on {message}")
+                    continue
+                if email_data is None:
+                    continue
+                if "user_respond" not in email_data:
+                    count += 1
+                yield email_data
+        # Surface any error that stopped the fetcher early
+        await fetcher
+    finally:
+        fetcher.cancel()
+
+    logger.info(f"Found {count} emails.")
+
+
+def mark_as_read(
+    message_id,
+    user_email: str,
+    gmail_token: str | None = None,
+    gmail_secret: str | None = None,
+):
+    creds = _run_sync(get_credentials(user_email))
+
+    service = _build_service("gmail", "v1", creds)
+    service.users().messages().modify(
+        userId="me", id=message_id, body={"removeLabelIds": ["UNREAD"]}
+    ).execute(num_retries=_NUM_RETRIES)
+
+
+class CalInput(BaseModel):
+    date_strs: list[str] = Field(
+        description="The days for which to retrieve events. Each day should be represented by dd-mm-yyyy string."
+    )
+
+
+@tool(args_schema=CalInput)
+def get_events_for_days(date_strs: list[str]):
+    """
+    Retrieves events for a list of days. If you want to check for multiple days, call this with multiple inputs.
+
+    Input in the format of ['dd-mm-yyyy', 'dd-mm-yyyy']
+
+    Args:
+    date_strs: The days for which to retrieve events (dd-mm-yyyy string).
+
+    Returns: availability for those days.
+    """
+    # Note: This function needs user_email from config - will be handled by calling code
+    config = ensure_config()
+    user_config = get_config(config)
+    user_email = user_config["email"]
+
+    # The agent often re-checks the same days within one turn, so recently
+    # formatted days are served from memory
+    now = monotonic()
+    days = {}
+    with _calendar_lock:
+        # Drop expired days so the cache only ever holds recent lookups
+        for key in [
+            key
+            for key, (cached_at, _) in _calendar_cache.items()
+            if now - cached_at >= _CALENDAR_CACHE_TTL
+        ]:
+            del _calendar_cache[key]
+        for date_str in date_strs:
+            if (cached := _calendar_cache.get((user_email, date_str))) is not None:
+                days[date_str] = cached[1]
+    missing = [
+        date_str for date_str in dict.fromkeys(date_strs) if date_str not in days
+    ]
+
+    if missing:
+        creds = _run_sync(get_credentials(user_email))
+        service = _build_service("calendar", "v3", creds)
+        # One batch round-trip covers every requested day
+        requests = {
+            date_str: _day_events_request(service, date_str) for date_str in missing
+        }
+        responses = _execute_batch(service, requests)
+        for date_str, request in requests.items():
+            if (events_result := responses.get(date_str)) is None:
+                days[date_str] = "Could not retrieve events for this day.\n"
+                continue
+            events = events_result.get("items", [])
+            # Busy days can span several pages; fetch the rest one by one
+            while (
+                request := service.events().list_next(request, events_result)
+            ) is not None:
+                events_result = request.execute(num_retries=_NUM_RETRIES)
+                events.extend(events_result.get("items", []))
+            days[date_str] = print_events(events)
+            with _calendar_lock:
+                _calendar_cache[(user_email, date_str)] = (monotonic(), days[date_str])
+
+    return "".join(
+        f"***FOR DAY {date_str}***\n\n{days[date_str]}" for date_str in date_strs
+    )
+
+
+def _day_events_request(service, date_str):
+    # Convert the dd-mm-yyyy date string to an ISO yyyy-mm-dd date
+    d, m, y = date_str.split("-")
+    day = date(int(y), int(m), int(d)).isoformat()
+
+    start_of_day = f"{day}T00:00:00Z"
+    end_of_day = f"{day}T23:59:59.999999Z"
+
+    return service.events().list(
+        calendarId="primary",
+        timeMin=start_of_day,
+        timeMax=end_of_day,
+        singleEvents=True,
+        orderBy="startTime",
+    )
+
+
+def format_datetime_with_timezone(dt_str, timezone="US/Pacific"):
+    """
+    Formats a datetime string with the specified timezone.
+
+    Args:
+    dt_str: The datetime string to format.
+    timezone: The timezone to use for formatting.
+
+    Returns:
+    A formatted datetime string with the timezone abbreviation.
+    """
+    dt = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+    dt = dt.astimezone(_get_timezone(timezone))
+    return dt.strftime("%Y-%m-%d %I:%M %p %Z")
+
+
+@lru_cache(maxsize=32)
+def _get_timezone(name):
+    return pytz.timezone(name)
+
+
+def print_events(events):
+    """
+    Prints the events in a human-readable format.
+
+    Args:
+    events: List of events to print.
+    """
+    if not events:
+        return "No events found for this day."
+
+    result = []
+
+    for event in events:
+        start = event["start"].get("dateTime", event["start"].get("date"))
+        end = event["end"].get("dateTime", event["end"].get("date"))
+        summary = event.get("summary", "No Title")
+
+        if "T" in start:  # Only format if it's a datetime
+            start = format_datetime_with_timezone(start)
+            end = format_datetime_with_timezone(end)
+
+        result.append(
+            f"Event: {summary}\nStarts: {start}\nEnds: {end}\n{_EVENT_SEPARATOR}"
+        )
+    return "".join(result)
+
+
+def send_calendar_invite(
+    emails, title, start_time, end_time, email_address, timezone="PST"
+):
+    creds = _run_sync(get_credentials(email_address))
+    service = _build_service("calendar", "v3", creds)
+
+    # Parse the start and end times
+    start_datetime = datetime.fromisoformat(start_time)
+    end_datetime = datetime.fromisoformat(end_time)
+    emails = list(set(emails + [email_address]))
+    event = {
+        "summary": title,
+        "start": {
+            "dateTime": start_datetime.isoformat(),
+            "timeZone": timezone,
+        },
+        "end": {
+            "dateTime": end_datetime.isoformat(),
+            "timeZone": timezone,
+        },
+        "attendees": [{"email": email} for email in emails],
+        "reminders": {
+            "useDefault": False,
+            "overrides": [
+                {"method": "email", "minutes": 24 * 60},
+                {"method": "popup", "minutes": 10},
+            ],
+        },
+        "conferenceData": {
+            "createRequest": {
+                "requestId": f"{title}-{start_datetime.isoformat()}",
+                "conferenceSolutionKey": {"type": "hangoutsMeet"},
+            }
+        },
+    }
+
+    try:
+        service.events().insert(
+            calendarId="primary",
+            body=event,
+            sendNotifications=True,
+            conferenceDataVersion=1,
+        ).execute()
+    except Exception as e:
+        logger.info(f"An error occurred while sending the calendar invite: {e}")
+        return False
+
+    # The new event changes this user's availability
+    with _calendar_lock:
+        for key in [key for key in _calendar_cache if key[0] == email_address]:
+            del _calendar_cache[key]
+    return True
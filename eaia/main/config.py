@@ -0,0 +1,31 @@
+import yaml
+from pathlib import Path
+
+try:
+    # libyaml's C scanner, when PyYAML was built with it
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+_ROOT = Path(__file__).absolute().parent
+_CONFIG_FILE = _ROOT.joinpath("config.yaml")
+# (mtime, parsed config.yaml), reused until the file's mtime changes
+_config_cache: tuple[int, dict] | None = None
+
+
+def get_config(config: dict):
+    global _config_cache
+    # This loads things either ALL from configurable, or
+    # all from the config.yaml
+    # This is done intentionally to enforce an "all or nothing" configuration
+    if "email" in config["configurable"]:
+        return config["configurable"]
+    else:
+        mtime = _CONFIG_FILE.stat().st_mtime_ns
+        cached = _config_cache
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(_CONFIG_FILE) as stream:
+            data = yaml.load(stream, Loader=_Loader)
+        _config_cache = (mtime, data)
+        return data